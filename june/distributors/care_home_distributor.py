@@ -1,11 +1,11 @@
 import logging
 import yaml
-from random import shuffle, randint
-from collections import OrderedDict, defaultdict
+from random import shuffle, randrange, random
 from itertools import chain
 
 import numpy as np
 import pandas as pd
+from numba import jit
 
 from june import paths
 from june.geography import Area, Areas, SuperArea, SuperAreas
@@ -22,12 +22,91 @@ default_communal_men_by_super_area = (
 default_communal_women_by_super_area = (
     paths.data_path / "input/care_homes/communal_female_residents_by_super_area.csv"
 )
+max_age_in_care_home = 120
 
 
 class CareHomeError(BaseException):
     pass
 
 
+@jit(nopython=True, cache=True)
+def _pick_age_in_range(people_per_age, age_1, age_2):
+    """
+    Picks an age between age_1 and age_2, both included, with probability
+    proportional to the number of people of that age. Returns -1 if there
+    is nobody in the range.
+    """
+    total = people_per_age[age_1 : age_2 + 1].sum()
+    if total == 0:
+        return -1
+    chosen_idx = int(random() * total)
+    for age in range(age_1, age_2 + 1):
+        if chosen_idx < people_per_age[age]:
+            return age
+        chosen_idx -= people_per_age[age]
+    return age_2
+
+
+@jit(nopython=True, cache=True)
+def _fill_care_homes(
+    age_ranges, men_counts, women_counts, free_places, men_per_age, women_per_age
+):
+    """
+    Fills the care homes of a super area. Care homes take one resident at a time
+    in turns, so that the oldest age ranges are shared among all of them. Each
+    resident is taken from the oldest age range with someone left, looking for
+    men first. Works on the number of people per age in each area, which is
+    updated in place together with the counts and free places.
+
+    Returns
+    -------
+    Array of (area index, sex index (0 men, 1 women), age) rows, one per
+    person that goes to a care home.
+    """
+    assignments = np.empty((free_places.sum(), 3), dtype=np.int64)
+    n_assigned = 0
+    max_age = men_per_age.shape[1] - 1
+    active_areas = np.nonzero(free_places > 0)[0]
+    n_active = active_areas.shape[0]
+    while n_active > 0:
+        n_still_active = 0
+        for k in range(n_active):
+            i = active_areas[k]
+            sex_idx = -1
+            for j in range(age_ranges.shape[0]):
+                age_1 = age_ranges[j, 0]
+                age_2 = min(age_ranges[j, 1], max_age)
+                if men_counts[j] > 0:
+                    age = _pick_age_in_range(men_per_age[i], age_1, age_2)
+                    if age >= 0:
+                        men_per_age[i, age] -= 1
+                        men_counts[j] -= 1
+                        sex_idx = 0
+                        break
+                elif women_counts[j] <= 0:
+                    continue
+                # find woman
+                age = _pick_age_in_range(women_per_age[i], age_1, age_2)
+                if age >= 0:
+                    women_per_age[i, age] -= 1
+                    women_counts[j] -= 1
+                    sex_idx = 1
+                    break
+            if sex_idx < 0:
+                # counts only decrease, so nobody will be found here later on
+                continue
+            free_places[i] -= 1
+            assignments[n_assigned, 0] = i
+            assignments[n_assigned, 1] = sex_idx
+            assignments[n_assigned, 2] = age
+            n_assigned += 1
+            if free_places[i] > 0:
+                active_areas[n_still_active] = i
+                n_still_active += 1
+        n_active = n_still_active
+    return assignments[:n_assigned]
+
+
 class CareHomeDistributor:
     def __init__(
         self,
@@ -63,18 +142,18 @@ class CareHomeDistributor:
             communal_women_by_super_area_filename, index_col=0
         )
         return cls(
-            communal_men_by_super_area=communal_men_df.T.to_dict(),
-            communal_women_by_super_area=communal_women_df.T.to_dict(),
+            communal_men_by_super_area=communal_men_df.to_dict(orient="index"),
+            communal_women_by_super_area=communal_women_df.to_dict(orient="index"),
             n_residents_per_worker=config["n_residents_per_worker"],
             workers_sector=config["workers_sector"],
         )
 
     def _create_people_dicts(self, area: Area):
         """
-        Creates dictionaries with the men and women per age key living in the area.
+        Creates lists with the men and women living in the area, indexed by age.
         """
-        men_by_age = defaultdict(list)
-        women_by_age = defaultdict(list)
+        men_by_age = [[] for _ in range(max_age_in_care_home + 1)]
+        women_by_age = [[] for _ in range(max_age_in_care_home + 1)]
         for person in area.people:
             if person.sex == "m":
                 men_by_age[person.age].append(person)
@@ -82,29 +161,22 @@ class CareHomeDistributor:
                 women_by_age[person.age].append(person)
         return men_by_age, women_by_age
 
-    def _find_person_in_age_range(self, people_by_age: dict, age_1, age_2):
-        available_people = []
-        for age in range(age_1, age_2 + 1):
-            available_people += people_by_age[age]
-        if not available_people:
-            return None
-        chosen_person_idx = randint(0, len(available_people) - 1)
-        chosen_person = available_people[chosen_person_idx]
-        people_by_age[chosen_person.age].remove(chosen_person)
-        if not people_by_age[chosen_person.age]:
-            del people_by_age[chosen_person.age]
-        return chosen_person
+    def _pop_random_person(self, people: list):
+        """
+        Removes and returns a random person from the list.
+        """
+        chosen_idx = randrange(len(people))
+        people[chosen_idx], people[-1] = people[-1], people[chosen_idx]
+        return people.pop()
 
     def _sort_dictionary_by_age_range_key(self, d: dict):
         """
-        Sorts a dictionary by decreasing order of the age range in the keys.
+        Sorts the (age_range, value) items of a dictionary by decreasing order
+        of the lower age of the age range in the keys.
         """
-        ret = OrderedDict()
-        ages = [age_range[0] for age_range in d.keys()]
-        men_age_ranges_sorted = np.array(list(d.keys()))[np.argsort(ages)[::-1]]
-        for key in men_age_ranges_sorted:
-            ret[key] = d[key]
-        return ret
+        return sorted(
+            d.items(), key=lambda item: int(item[0].split("-", 1)[0]), reverse=True
+        )
 
     def populate_care_homes_in_super_areas(self, super_areas: SuperAreas):
         """
@@ -125,6 +197,19 @@ class CareHomeDistributor:
             communal_women_sorted = self._sort_dictionary_by_age_range_key(
                 women_communal_residents
             )
+            age_ranges = np.array(
+                [
+                    tuple(map(int, age_range.split("-")))
+                    for age_range, _ in communal_men_sorted
+                ],
+                dtype=np.int64,
+            ).reshape(-1, 2)
+            men_counts = np.array(
+                [count for _, count in communal_men_sorted], dtype=np.int64
+            )
+            women_counts = np.array(
+                [count for _, count in communal_women_sorted], dtype=np.int64
+            )
             areas_with_care_homes = [
                 area for area in super_area.areas if area.care_home is not None
             ]
@@ -134,50 +219,36 @@ class CareHomeDistributor:
             areas_dicts = [
                 self._create_people_dicts(area) for area in areas_with_care_homes
             ]
-            found_person = True
-            assert communal_men_sorted.keys() == communal_women_sorted.keys()
-            while found_person:
-                found_person = False
-                for i, area in enumerate(areas_with_care_homes):
-                    care_home = area.care_home
-                    if len(care_home.residents) < care_home.n_residents:
-                        # look for men first
-                        for age_range in communal_men_sorted:
-                            age1, age2 = list(map(int, age_range.split("-")))
-                            if communal_men_sorted[age_range] <= 0:
-                                if communal_women_sorted[age_range] <= 0:
-                                    continue
-                                # find woman
-                                person = self._find_person_in_age_range(
-                                    areas_dicts[i][1], age1, age2
-                                )
-                                if person is None:
-                                    continue
-                                care_home.add(person)
-                                communal_women_sorted[age_range] -= 1
-                                total_care_home_residents += 1
-                                found_person = True
-                                break
-                            person = self._find_person_in_age_range(
-                                areas_dicts[i][0], age1, age2
-                            )
-                            if person is None:
-                                # find woman
-                                person = self._find_person_in_age_range(
-                                    areas_dicts[i][1], age1, age2
-                                )
-                                if person is None:
-                                    continue 
-                                care_home.add(person)
-                                communal_women_sorted[age_range] -= 1
-                                total_care_home_residents += 1
-                                found_person = True
-                                break
-                            care_home.add(person)
-                            communal_men_sorted[age_range] -= 1
-                            total_care_home_residents += 1
-                            found_person = True
-                            break
+            assert [age_range for age_range, _ in communal_men_sorted] == [
+                age_range for age_range, _ in communal_women_sorted
+            ]
+            free_places = np.array(
+                [
+                    max(area.care_home.n_residents - len(area.care_home.residents), 0)
+                    for area in areas_with_care_homes
+                ],
+                dtype=np.int64,
+            )
+            men_per_age = np.array(
+                [[len(people) for people in men] for men, _ in areas_dicts],
+                dtype=np.int64,
+            ).reshape(-1, max_age_in_care_home + 1)
+            women_per_age = np.array(
+                [[len(people) for people in women] for _, women in areas_dicts],
+                dtype=np.int64,
+            ).reshape(-1, max_age_in_care_home + 1)
+            assignments = _fill_care_homes(
+                age_ranges,
+                men_counts,
+                women_counts,
+                free_places,
+                men_per_age,
+                women_per_age,
+            )
+            for i, sex_idx, age in assignments:
+                person = self._pop_random_person(areas_dicts[i][sex_idx][age])
+                areas_with_care_homes[i].care_home.add(person)
+            total_care_home_residents += len(assignments)
         logger.info(
             f"This world has {total_care_home_residents} people living in care homes."
         )
@@ -195,21 +266,23 @@ class CareHomeDistributor:
                 person
                 for person in super_area.workers
                 if (
-                    person.sector == "Q"
+                    person.sector == self.workers_sector
                     and person.primary_activity is None
                     and person.sub_sector is None
                 )
             ]
             shuffle(carers)
+            carer_idx = 0
+            n_carers = len(carers)
             for care_home in care_homes:
                 while len(care_home.workers) < care_home.n_workers:
-                    try:
-                        carer = carers.pop()
-                    except:
+                    if carer_idx >= n_carers:
                         logger.info(
                             f"Care home in area {care_home.area.name} has not enough workers!"
                         )
                         break
+                    carer = carers[carer_idx]
+                    carer_idx += 1
                     care_home.add(
                         person=carer,
                         subgroup_type=care_home.SubgroupType.workers,
@@ -15,6 +15,7 @@ default_config_filename = (
 logger = logging.getLogger("school_distributor")
 
 EARTH_RADIUS = 6371  # km
+AREAS_PER_TREE_QUERY = 4000
 
 default_decoder = {
     2314: "secondary",
@@ -57,7 +58,9 @@ class SchoolDistributor:
         self.neighbour_schools = neighbour_schools
         self.school_age_range = age_range
         self.mandatory_school_age_range = mandatory_age_range
-        self.education_sector_label = education_sector_label
+        if isinstance(education_sector_label, str):
+            education_sector_label = [education_sector_label]
+        self.education_sector_labels = frozenset(education_sector_label)
         self.teacher_min_age = teacher_min_age
         self.teacher_student_ratio_primary = teacher_student_ratio_primary
         self.teacher_student_ratio_secondary = teacher_student_ratio_secondary
@@ -119,29 +122,35 @@ class SchoolDistributor:
         Function to distribute kids to schools according to distance 
         """
         logger.info(f"Distributing kids to schools")
-        for i, area in enumerate(areas):
-            if i % 4000 == 0:
-                logger.info(f"Distributed kids in {i} of {len(areas)} areas.")
-            closest_schools_by_age = {}
-            is_school_full = {}
-            for agegroup in self.schools.school_trees:
-                closest_schools = []
-                closest_schools_idx = self.schools.get_closest_schools(
-                    agegroup, area.coordinates, self.neighbour_schools,
+        for batch_start in range(0, len(areas), AREAS_PER_TREE_QUERY):
+            logger.info(f"Distributed kids in {batch_start} of {len(areas)} areas.")
+            areas_batch = areas[batch_start : batch_start + AREAS_PER_TREE_QUERY]
+            coordinates = np.array([area.coordinates for area in areas_batch])
+            # one tree query per age group for the whole batch of areas
+            closest_schools_idx_by_age = {
+                agegroup: self.schools.get_closest_schools(
+                    agegroup, coordinates, self.neighbour_schools,
                 )
-                for idx in closest_schools_idx:
-                    real_idx = self.schools.school_agegroup_to_global_indices[agegroup][
-                        idx
+                for agegroup in self.schools.school_trees
+            }
+            for j, area in enumerate(areas_batch):
+                closest_schools_by_age = {}
+                is_school_full = {}
+                for agegroup, closest_schools_idx in closest_schools_idx_by_age.items():
+                    global_indices = self.schools.school_agegroup_to_global_indices[
+                        agegroup
                     ]
-                    closest_schools.append(self.schools.members[real_idx])
-                closest_schools_by_age[agegroup] = closest_schools
-                is_school_full[agegroup] = False
-            self.distribute_mandatory_kids_to_school(
-                area, is_school_full, closest_schools_by_age
-            )
-            self.distribute_non_mandatory_kids_to_school(
-                area, is_school_full, closest_schools_by_age
-            )
+                    closest_schools_by_age[agegroup] = [
+                        self.schools.members[global_indices[idx]]
+                        for idx in closest_schools_idx[j]
+                    ]
+                    is_school_full[agegroup] = False
+                self.distribute_mandatory_kids_to_school(
+                    area, is_school_full, closest_schools_by_age
+                )
+                self.distribute_non_mandatory_kids_to_school(
+                    area, is_school_full, closest_schools_by_age
+                )
         logger.info(f"Kids distributed to schools")
 
     def distribute_mandatory_kids_to_school(
@@ -152,42 +161,33 @@ class SchoolDistributor:
         that has vacancies. If none of them has vacancies, pick one of them
         at random (making it larger than it should be)
         """
-        for person in area.people:
-            if (
-                person.age <= self.mandatory_school_age_range[1]
-                and person.age >= self.mandatory_school_age_range[0]
-            ):
-                if person.age not in is_school_full:
+        closest_schools_and_caps = {
+            age: (closest_schools, min(len(closest_schools), self.neighbour_schools))
+            for age, closest_schools in closest_schools_by_age.items()
+        }
+        # one uniform draw per person, used to pick a random school when the
+        # closest ones are full
+        random_numbers = np.random.random(len(area.people))
+        mandatory_age_min, mandatory_age_max = self.mandatory_school_age_range
+        for person, random_number in zip(area.people, random_numbers):
+            age = person.age
+            if mandatory_age_min <= age <= mandatory_age_max:
+                if age not in is_school_full:
                     continue
-                if is_school_full[person.age]:
-                    random_number = np.random.randint(
-                        0,
-                        min(
-                            len(closest_schools_by_age[person.age]),
-                            self.neighbour_schools,
-                        ),
-                    )
-                    school = closest_schools_by_age[person.age][random_number]
+                closest_schools, n_closest_schools = closest_schools_and_caps[age]
+                if is_school_full[age]:
+                    school = closest_schools[int(random_number * n_closest_schools)]
                 else:
                     schools_full = 0
-                    for i in range(self.neighbour_schools):  # look for non full school
-                        if i >= len(closest_schools_by_age[person.age]):
-                            break
-                        school = closest_schools_by_age[person.age][i]
+                    for i in range(n_closest_schools):  # look for non full school
+                        school = closest_schools[i]
                         if school.n_pupils >= school.n_pupils_max:
                             schools_full += 1
                         else:
                             break
 
-                        is_school_full[person.age] = True
-                        random_number = np.random.randint(
-                            0,
-                            min(
-                                len(closest_schools_by_age[person.age]),
-                                self.neighbour_schools,
-                            ),
-                        )
-                        school = closest_schools_by_age[person.age][random_number]
+                        is_school_full[age] = True
+                        school = closest_schools[int(random_number * n_closest_schools)]
                     else:  # just keep the school saved in the previous for loop
                         pass
                 # remove from working population
@@ -203,26 +203,24 @@ class SchoolDistributor:
         send them to the closest school that has vacancies among the self.max_schools closests.
         If none of them has vacancies do not send them to school
         """
+        age_min, age_max = self.school_age_range
+        mandatory_age_min, mandatory_age_max = self.mandatory_school_age_range
+        neighbour_schools = self.neighbour_schools
         for person in area.people:
-            if (
-                self.school_age_range[0]
-                < person.age
-                < self.mandatory_school_age_range[0]
-                or self.mandatory_school_age_range[1]
-                < person.age
-                < self.school_age_range[1]
-            ):
-                if person.age not in is_school_full or is_school_full[person.age]:
+            age = person.age
+            if age_min < age < mandatory_age_min or mandatory_age_max < age < age_max:
+                if age not in is_school_full or is_school_full[age]:
                     continue
                 else:
                     find_school = False
-                    for i in range(self.neighbour_schools):  # look for non full school
-                        if i >= len(closest_schools_by_age[person.age]):
+                    closest_schools = closest_schools_by_age[age]
+                    for i in range(neighbour_schools):  # look for non full school
+                        if i >= len(closest_schools):
                             # TEST THIS
                             break
-                        school = closest_schools_by_age[person.age][i]
+                        school = closest_schools[i]
                         # check number of students in that age group
-                        yearindex = person.age - school.age_min + 1
+                        yearindex = age - school.age_min + 1
                         n_pupils_age = len(school.subgroups[yearindex].people)
                         if (school.n_pupils < school.n_pupils_max) and (
                             n_pupils_age
@@ -285,27 +283,23 @@ class SchoolDistributor:
                         else:
                             secondary_schools.append(school)
         # assign teacher to student ratios in schools
-        for school in primary_schools:
-            school.n_teachers_max = int(
-                np.round(
-                    school.n_pupils
-                    / np.random.poisson(self.teacher_student_ratio_primary)
-                )
-            )
-        for school in secondary_schools:
-            school.n_teachers_max = int(
-                np.round(
-                    school.n_pupils
-                    / np.random.poisson(self.teacher_student_ratio_secondary)
-                )
-            )
+        primary_ratios = np.random.poisson(
+            self.teacher_student_ratio_primary, size=len(primary_schools)
+        )
+        for school, ratio in zip(primary_schools, primary_ratios):
+            school.n_teachers_max = int(np.round(school.n_pupils / ratio))
+        secondary_ratios = np.random.poisson(
+            self.teacher_student_ratio_secondary, size=len(secondary_schools)
+        )
+        for school, ratio in zip(secondary_schools, secondary_ratios):
+            school.n_teachers_max = int(np.round(school.n_pupils / ratio))
 
         np.random.shuffle(primary_schools)
         np.random.shuffle(secondary_schools)
         all_teachers = [
             person
             for person in super_area.workers
-            if person.sector == self.education_sector_label
+            if person.sector in self.education_sector_labels
             and person.age > self.teacher_min_age
             and person.primary_activity is None
         ]
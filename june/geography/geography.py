@@ -433,17 +433,14 @@ class Geography:
         if isinstance(area_coords, pd.Series):
             areas = [Area(area_coords.name, super_area, area_coords.values)]
         else:
-            areas = []
-            for name, coordinates in area_coords.iterrows():
-                areas.append(
-                    Area(
-                        name,
-                        super_area,
-                        coordinates=np.array(
-                            [coordinates.latitude, coordinates.longitude]
-                        ),
-                    )
+            areas = [
+                Area(name, super_area, coordinates=np.array([latitude, longitude]))
+                for name, latitude, longitude in zip(
+                    area_coords.index,
+                    area_coords["latitude"].to_numpy(),
+                    area_coords["longitude"].to_numpy(),
                 )
+            ]
         return areas
 
     @classmethod
@@ -490,17 +487,21 @@ class Geography:
             super_areas_list[0].areas = areas_list
             total_areas_list += areas_list
         else:
-            for super_area_name, row in super_area_coords.iterrows():
+            for super_area_name, latitude, longitude in zip(
+                super_area_coords.index,
+                super_area_coords["latitude"].to_numpy(),
+                super_area_coords["longitude"].to_numpy(),
+            ):
                 super_area = SuperArea(
                     areas=None,
                     name=super_area_name,
-                    coordinates=np.array([row.latitude, row.longitude]),
+                    coordinates=np.array([latitude, longitude]),
                     region=region,
                 )
                 areas_df = area_coords.loc[area_hierarchy.loc[super_area_name, "area"]]
                 areas_list = cls._create_areas(areas_df, super_area)
                 super_area.areas = areas_list
-                total_areas_list += list(areas_list)
+                total_areas_list.extend(areas_list)
                 super_areas_list.append(super_area)
         return super_areas_list, total_areas_list
 
@@ -531,8 +532,8 @@ class Geography:
                 super_areas_df, area_coordinates, region, hierarchy=hierarchy
             )
             region.super_areas = super_areas_list
-            total_super_areas_list += list(super_areas_list)
-            total_areas_list += list(areas_list)
+            total_super_areas_list.extend(super_areas_list)
+            total_areas_list.extend(areas_list)
             region_list.append(region)
         if sort_identifiers:
             total_areas_list = sort_geo_unit_by_identifier(total_areas_list)
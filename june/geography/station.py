@@ -113,21 +113,14 @@ class Stations(Supergroup):
             The distance from the center to the each station 
         """
         stations = []
-        angle = 0
-        delta_angle = 2 * np.pi / number_of_stations
-        x = distance_to_city_center
-        y = 0
+        angles = np.arange(number_of_stations) * (2 * np.pi / number_of_stations)
+        x = distance_to_city_center * np.cos(angles)
+        y = distance_to_city_center * np.sin(angles)
         city_coordinates = city.coordinates
-        for i in range(number_of_stations):
-            station_position = add_distance_to_lat_lon(
-                city_coordinates[0],
-                city_coordinates[1],
-                x=x,
-                y=y
-            )
-            angle += delta_angle
-            x = distance_to_city_center * np.cos(angle)
-            y = distance_to_city_center * np.sin(angle)
+        station_latitudes, station_longitudes = add_distance_to_lat_lon(
+            city_coordinates[0], city_coordinates[1], x=x, y=y
+        )
+        for station_position in zip(station_latitudes, station_longitudes):
             super_area = super_areas.get_closest_super_area(np.array(station_position))
             if type == "city_station":
                 station = CityStation(city=city.name, super_area=super_area,)
@@ -139,7 +132,10 @@ class Stations(Supergroup):
         return cls(stations)
 
     def _construct_ball_tree(self):
-        coordinates = np.array([np.deg2rad(station.coordinates) for station in self])
+        coordinates = np.empty((len(self.members), 2), dtype=np.float64)
+        for i, station in enumerate(self.members):
+            coordinates[i] = station.coordinates
+        np.deg2rad(coordinates, out=coordinates)
         self._ball_tree = BallTree(coordinates, metric="haversine")
 
     def get_closest_station(self, coordinates):
@@ -384,23 +384,28 @@ class Schools(Supergroup):
         age:
             age of the pupil
         coordinates: 
-            latitude and longitude
+            latitude and longitude, or an array of shape (N, 2) with the
+            latitudes and longitudes of N points to query at once
         k:
             k-th neighbour
 
         Returns
         -------
         ID of the k-th closest school, within school trees for 
-        a given age group
+        a given age group. If N coordinates are given, an array
+        of shape (N, k) with the IDs for each coordinate.
 
         """
         school_tree = self.school_trees[age]
-        coordinates_rad = np.deg2rad(coordinates).reshape(1, -1)
+        coordinates = np.array(coordinates)
+        coordinates_rad = np.deg2rad(coordinates).reshape(-1, 2)
         k = min(k, school_tree.data.shape[0])
         distances, neighbours = school_tree.query(
             coordinates_rad, k=k, sort_results=True,
         )
-        return neighbours[0]
+        if coordinates.ndim == 1:
+            return neighbours[0]
+        return neighbours
 
 
 # interactive group of schools
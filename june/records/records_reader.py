@@ -18,7 +18,7 @@ class RecordReader:
         self.world_summary = self.get_world_summary()
 
     def decode_bytes_columns(self, df):
-        str_df = df.select_dtypes([np.object])
+        str_df = df.select_dtypes([object])
         for col in str_df:
             df[col] = str_df[col].str.decode("utf-8")
         return df
@@ -43,16 +43,21 @@ class RecordReader:
     def table_to_df(
         self, table_name: str, index: str = "id", fields: Optional[Tuple] = None
     ) -> pd.DataFrame:
-        # TODO: include fields to read only certain columns
         with tables.open_file(self.results_path / "june_record.h5", mode="r") as f:
             table = getattr(f.root, table_name)
-            df = pd.DataFrame.from_records(table.read(), index=index)
+            records = table.read()
+        if fields is not None:
+            # one read of the whole table beats a Table.col call per field, but
+            # only the requested columns are turned into the data frame
+            columns = [index] + [field for field in fields if field != index]
+            records = records[columns]
+        df = pd.DataFrame.from_records(records, index=index)
         df = self.decode_bytes_columns(df)
         return df
 
     def get_geography_df(self,):
-        areas_df = self.table_to_df("areas")
-        super_areas_df = self.table_to_df("super_areas")
+        areas_df = self.table_to_df("areas", fields=("super_area_id", "name"))
+        super_areas_df = self.table_to_df("super_areas", fields=("region_id", "name"))
         regions_df = self.table_to_df("regions")
 
         geography_df = areas_df[["super_area_id", "name"]].merge(
@@ -501,18 +501,20 @@ class Simulator:
 
         # main interaction loop
         infected_ids = []
+        delta_time = self.timer.duration
         for super_group in super_group_instances:
+            people_from_abroad_spec = people_from_abroad_dict.get(
+                super_group.group_spec, {}
+            )
             for group in super_group:
                 if group.external:
                     continue
                 else:
-                    people_from_abroad = people_from_abroad_dict.get(
-                        group.spec, {}
-                    ).get(group.id, None)
+                    people_from_abroad = people_from_abroad_spec.get(group.id, None)
                     new_infected_ids, group_size = self.interaction.time_step_for_group(
                         group=group,
                         people_from_abroad=people_from_abroad,
-                        delta_time=self.timer.duration,
+                        delta_time=delta_time,
                         record=self.record,
                     )
                     infected_ids += new_infected_ids
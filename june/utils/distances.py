@@ -1,12 +1,35 @@
 import math
 import numpy as np
+
 earth_radius = 6371  # km
 
+
+def _haversine_distance(lat1, lon1, lat2, lon2):
+    """
+    Haversine distance in km between arrays of points given in radians.
+    """
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+    # rounding can push a just over 1 for near-antipodal points
+    return 2 * earth_radius * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
 def haversine_distance(origin, destination):
     """
+    Haversine distance in km between origin and destination, given as (lat, lon)
+    pairs in degrees. Both arguments can also be numpy arrays of shape (N, 2), in
+    which case the N distances are computed at once.
+
     Taken from https://gist.github.com/rochacbruno/2883505
     # Author: Wayne Dyck
     """
+    if getattr(origin, "ndim", 1) > 1 or getattr(destination, "ndim", 1) > 1:
+        origin = np.deg2rad(origin)
+        destination = np.deg2rad(destination)
+        return _haversine_distance(
+            origin[..., 0], origin[..., 1], destination[..., 0], destination[..., 1]
+        )
     lat1, lon1 = origin
     lat2, lon2 = destination
 
@@ -15,10 +38,12 @@ def haversine_distance(origin, destination):
     a = math.sin(dlat / 2) * math.sin(dlat / 2) + math.cos(
         math.radians(lat1)
     ) * math.cos(math.radians(lat2)) * math.sin(dlon / 2) * math.sin(dlon / 2)
+    a = min(a, 1.0)
     c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
     d = earth_radius * c
     return d
 
+
 def add_distance_to_lat_lon(latitude, longitude, x, y):
     """
     Given a latitude and a longitude (in degrees), and two distances (x, y) in km, adds those distances
@@ -1,7 +1,14 @@
 import yaml
+import numpy as np
 import pytest
 from june import paths
-from june.distributors.care_home_distributor import CareHomeDistributor, CareHomeError
+from june.distributors.care_home_distributor import (
+    CareHomeDistributor,
+    CareHomeError,
+    _pick_age_in_range,
+    _fill_care_homes,
+    max_age_in_care_home,
+)
 from june.demography import Person
 from june.groups.care_home import CareHome, CareHomes
 from june.geography import Geography, Area, SuperArea, Areas, SuperAreas
@@ -166,3 +173,111 @@ class TestCareHomeDistributor:
                 assert worker.sector == "Q"
 
 
+
+
+def test__care_homes_share_oldest_age_range():
+    super_area = SuperArea(name="super_area")
+    areas = [Area(super_area=super_area, name=f"area_{i}") for i in range(2)]
+    super_area.areas = areas
+    for area, n_oldest in zip(areas, (6, 8)):
+        for _ in range(n_oldest):
+            area.people.append(Person.from_attributes(age=92, sex="m"))
+        for _ in range(20):
+            area.people.append(Person.from_attributes(age=75, sex="m"))
+        area.care_home = CareHome(n_residents=20, n_workers=1, area=area)
+    carehome_distributor = CareHomeDistributor(
+        communal_men_by_super_area={"super_area": {"90-99": 10, "70-79": 30}},
+        communal_women_by_super_area={"super_area": {"90-99": 0, "70-79": 0}},
+    )
+    carehome_distributor.populate_care_homes_in_super_areas(super_areas=[super_area])
+    # care homes take residents in turns, so both get half of the oldest ones
+    # whichever of them goes first
+    for area in areas:
+        residents = area.care_home.residents
+        assert len(residents) == 20
+        assert len([person for person in residents if person.age >= 90]) == 5
+
+
+def _people_per_age(n_areas, people):
+    people_per_age = np.zeros((n_areas, max_age_in_care_home + 1), dtype=np.int64)
+    for (area_idx, age), n_people in people.items():
+        people_per_age[area_idx, age] = n_people
+    return people_per_age
+
+
+def test__pick_age_in_range():
+    people_per_age = _people_per_age(1, {(0, 70): 2, (0, 85): 3})[0]
+    assert _pick_age_in_range(people_per_age, 0, 60) == -1
+    assert _pick_age_in_range(people_per_age, 80, 90) == 85
+    for _ in range(20):
+        assert _pick_age_in_range(people_per_age, 60, 100) in (70, 85)
+    assert _pick_age_in_range(np.zeros_like(people_per_age), 0, 120) == -1
+
+
+def test__fill_care_homes_looks_for_men_first():
+    men_counts = np.array([2], dtype=np.int64)
+    women_counts = np.array([5], dtype=np.int64)
+    free_places = np.array([4], dtype=np.int64)
+    men_per_age = _people_per_age(1, {(0, 80): 3})
+    women_per_age = _people_per_age(1, {(0, 80): 3})
+    assignments = _fill_care_homes(
+        np.array([[60, 100]], dtype=np.int64),
+        men_counts,
+        women_counts,
+        free_places,
+        men_per_age,
+        women_per_age,
+    )
+    # men until the super area count is exhausted, then women
+    assert list(assignments[:, 1]) == [0, 0, 1, 1]
+    assert (assignments[:, 0] == 0).all()
+    assert (assignments[:, 2] == 80).all()
+    assert men_counts[0] == 0
+    assert women_counts[0] == 3
+    assert free_places[0] == 0
+    assert men_per_age[0, 80] == 1
+    assert women_per_age[0, 80] == 1
+
+
+def test__fill_care_homes_falls_back_to_women():
+    age_ranges = np.array([[60, 100], [0, 59]], dtype=np.int64)
+    men_counts = np.array([5, 5], dtype=np.int64)
+    women_counts = np.array([5, 0], dtype=np.int64)
+    free_places = np.array([3], dtype=np.int64)
+    men_per_age = _people_per_age(1, {(0, 40): 5})
+    women_per_age = _people_per_age(1, {(0, 90): 2})
+    assignments = _fill_care_homes(
+        age_ranges, men_counts, women_counts, free_places, men_per_age, women_per_age
+    )
+    # no men in the oldest range, so its women go first
+    assert [tuple(row) for row in assignments] == [(0, 1, 90), (0, 1, 90), (0, 0, 40)]
+    assert list(men_counts) == [5, 4]
+    assert list(women_counts) == [3, 0]
+
+
+def test__fill_care_homes_without_care_homes():
+    empty = np.zeros((0, max_age_in_care_home + 1), dtype=np.int64)
+    assignments = _fill_care_homes(
+        np.array([[60, 100]], dtype=np.int64),
+        np.array([5], dtype=np.int64),
+        np.array([5], dtype=np.int64),
+        np.zeros(0, dtype=np.int64),
+        empty,
+        empty.copy(),
+    )
+    assert assignments.shape == (0, 3)
+
+
+def test__super_area_without_care_homes():
+    super_area = SuperArea(name="super_area")
+    area = Area(super_area=super_area, name="area")
+    super_area.areas = [area]
+    for _ in range(5):
+        area.people.append(Person.from_attributes(age=85, sex="f"))
+    carehome_distributor = CareHomeDistributor(
+        communal_men_by_super_area={"super_area": {"0-99": 5}},
+        communal_women_by_super_area={"super_area": {"0-99": 5}},
+    )
+    carehome_distributor.populate_care_homes_in_super_areas(super_areas=[super_area])
+    assert area.care_home is None
+    carehome_distributor.distribute_workers_to_care_homes(super_areas=[super_area])
@@ -1,6 +1,7 @@
 import os
 import unittest
 from pathlib import Path
+from types import SimpleNamespace
 
 import numpy as np
 import pytest
@@ -53,6 +54,34 @@ def create_population(worker_geography, worker_demography):
     return population
 
 
+@pytest.fixture(name="worker_attrs", scope="module")
+def extract_worker_attributes(worker_population):
+    n_people = len(worker_population)
+    ages = np.fromiter(
+        (person.age for person in worker_population), dtype=np.int16, count=n_people
+    )
+    sexes = np.array([person.sex for person in worker_population])
+    sectors = np.array([person.sector for person in worker_population], dtype=object)
+    sub_sectors = np.array(
+        [person.sub_sector for person in worker_population], dtype=object
+    )
+    work_super_area_names = np.array(
+        [
+            None if person.work_super_area is None else person.work_super_area.name
+            for person in worker_population
+        ],
+        dtype=object,
+    )
+    return SimpleNamespace(
+        ages=ages,
+        sexes=sexes,
+        sectors=sectors,
+        sub_sectors=sub_sectors,
+        work_super_area_names=work_super_area_names,
+        has_work_super_area=work_super_area_names != None,
+    )
+
+
 def test__load_workflow_df(worker_super_areas):
     wf_df = load_workflow_df(area_names=worker_super_areas,)
     assert wf_df["n_man"].sum() == len(worker_super_areas)
@@ -88,57 +117,38 @@ class TestDistribution:
         self,
         worker_config: dict,
         worker_super_areas: list,
-        worker_population: Population,
+        worker_attrs: SimpleNamespace,
     ):
         case = unittest.TestCase()
-        work_super_area_name = np.array(
-            [
-                person.work_super_area.name
-                for person in worker_population
-                if (
-                    worker_config["age_range"][0]
-                    <= person.age
-                    <= worker_config["age_range"][1]
-                )
-                and person.work_super_area is not None
-            ]
-        )
-        work_super_area_name = list(np.unique(work_super_area_name))
+        age_min, age_max = worker_config["age_range"]
+        in_age_range = (age_min <= worker_attrs.ages) & (worker_attrs.ages <= age_max)
+        work_super_area_name = worker_attrs.work_super_area_names[
+            in_age_range & worker_attrs.has_work_super_area
+        ]
+        work_super_area_name = list(np.unique(work_super_area_name.astype(str)))
         case.assertCountEqual(work_super_area_name, worker_super_areas)
 
     def test__workers_that_stay_home(
-        self, worker_config: dict, worker_population: Population,
+        self, worker_config: dict, worker_attrs: SimpleNamespace,
     ):
-        nr_working_from_home = len(
-            [
-                person.work_super_area
-                for person in worker_population
-                if (
-                    worker_config["age_range"][0]
-                    <= person.age
-                    <= worker_config["age_range"][1]
-                )
-                and person.work_super_area is None 
-            ]
+        age_min, age_max = worker_config["age_range"]
+        in_age_range = (age_min <= worker_attrs.ages) & (worker_attrs.ages <= age_max)
+        nr_working_from_home = np.count_nonzero(
+            in_age_range & ~worker_attrs.has_work_super_area
         )
-        assert 0.050 < nr_working_from_home / len(worker_population) < 0.070
+        assert 0.050 < nr_working_from_home / len(worker_attrs.ages) < 0.070
 
     def test__worker_nr_in_sector_larger_than_its_sub(
-        self,
-        worker_config: dict,
-        worker_population: Population,
+        self, worker_config: dict, worker_attrs: SimpleNamespace,
     ):
-        occupations = np.array(
-            [
-                [person.sex, person.sector, person.sub_sector]
-                for person in worker_population
-                if person.sector in list(worker_config["sub_sector_ratio"].keys())
-            ]
-        ).T
-        p_sex = occupations[0]
-        p_sectors = occupations[1][p_sex == "m"]
-        p_sub_sectors = occupations[2][p_sex == "m"]
-        for sector in list(worker_config["sub_sector_ratio"].keys()):
+        sub_sector_keys = set(worker_config["sub_sector_ratio"].keys())
+        in_sub_sector_keys = np.array(
+            [sector in sub_sector_keys for sector in worker_attrs.sectors], dtype=bool
+        )
+        is_man = in_sub_sector_keys & (worker_attrs.sexes == "m")
+        p_sectors = worker_attrs.sectors[is_man]
+        p_sub_sectors = worker_attrs.sub_sectors[is_man]
+        for sector in sub_sector_keys:
             idx = np.where(p_sectors == sector)[0]
             sector_worker_nr = len(idx)
             p_sub_sector = p_sub_sectors[idx]
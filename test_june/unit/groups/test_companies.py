@@ -4,7 +4,6 @@ from pathlib import Path
 import pytest
 import numpy as np
 import pandas as pd
-from collections import defaultdict
 
 from june.geography import Geography, Area
 from june.demography import Person
@@ -57,12 +56,11 @@ def create_companies(super_area_companies):
 
 def test__company_sizes(companies_example):
     assert len(companies_example) == 610
-    sizes_dict = defaultdict(int)
     bins = [0, 10, 20, 50, 100, 250, 500, 1000, 1500]
-    for company in companies_example:
-        size = company.n_workers_max
-        idx = np.searchsorted(bins, size) - 1
-        sizes_dict[idx] += 1
+    sizes = np.array([company.n_workers_max for company in companies_example])
+    # shift by one so that sizes falling below the first bin edge get their own count
+    counts = np.bincount(np.searchsorted(bins, sizes), minlength=len(bins) + 1)
+    sizes_dict = dict(enumerate(counts[1:]))
     assert np.isclose(sizes_dict[0], 505, atol=10)
     assert np.isclose(sizes_dict[1], 40, atol=10)
     assert np.isclose(sizes_dict[2], 40, atol=10)
@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 import numpy as np
+import pandas as pd
 import pytest
 
 from june.geography import Geography
@@ -63,4 +64,33 @@ class TestSchools:
         ]
         assert closest_school == school
 
-
+    def test__closest_schools_for_many_coordinates(self):
+        school_df = pd.DataFrame(
+            {
+                "latitude": [51.50, 51.52, 51.55, 51.60, 51.70],
+                "longitude": [-0.10, -0.12, -0.08, -0.20, 0.00],
+                "age_min": 5,
+                "age_max": 11,
+            }
+        )
+        school_trees, agegroup_to_global_indices = Schools.init_trees(
+            school_df, age_range=(0, 19)
+        )
+        schools = Schools(
+            [],
+            school_trees=school_trees,
+            agegroup_to_global_indices=agegroup_to_global_indices,
+        )
+        coordinates = np.array([[51.51, -0.11], [51.58, -0.15], [51.69, 0.01]])
+        closest_schools = schools.get_closest_schools(8, coordinates, 3)
+        assert closest_schools.shape == (3, 3)
+        for coordinate, closest in zip(coordinates, closest_schools):
+            assert list(closest) == list(
+                schools.get_closest_schools(8, coordinate, 3)
+            )
+        # a batch with a single area keeps the batch dimension
+        closest_schools = schools.get_closest_schools(8, coordinates[:1], 3)
+        assert closest_schools.shape == (1, 3)
+        assert list(closest_schools[0]) == list(
+            schools.get_closest_schools(8, coordinates[0], 3)
+        )
@@ -1255,6 +1255,28 @@ class TestLimitLongCommute:
         distance = haversine_distance(area.coordinates, super_area.coordinates)
         assert 100 < distance < 150
 
+    def test__haversine_distance_for_arrays(self):
+        origins = np.array([[0, 1], [51.5, -0.1], [40.4, -3.7]])
+        destinations = np.array([[0, 0], [52.2, 0.1], [48.9, 2.4]])
+        distances = haversine_distance(origins, destinations)
+        assert distances.shape == (3,)
+        for origin, destination, distance in zip(origins, destinations, distances):
+            assert np.isclose(distance, haversine_distance(origin, destination))
+        # a single pair given as a (1, 2) array
+        distances = haversine_distance(origins[:1], destinations[:1])
+        assert distances.shape == (1,)
+        assert np.isclose(distances[0], haversine_distance(origins[0], destinations[0]))
+
+    def test__haversine_distance_antipodal(self):
+        # these points make the haversine term round to just above 1
+        origin = np.array([2.5, -180.0])
+        destination = np.array([-2.5, 0.0])
+        half_circumference = np.pi * 6371
+        assert np.isclose(haversine_distance(origin, destination), half_circumference)
+        distances = haversine_distance(origin[np.newaxis], destination[np.newaxis])
+        assert not np.isnan(distances).any()
+        assert np.isclose(distances[0], half_circumference)
+
     def test__distance_policy_check(self):
         worker = Person.from_attributes()
         area = Area(coordinates=[0, 1])
@@ -6,7 +6,7 @@ import yaml
 import pytest
 from tables import open_file
 from june import paths
-from june.records import Record
+from june.records import Record, RecordReader
 from june.groups import Hospital, Hospitals, Household, Households, CareHome, CareHomes
 from june.policy import Policies
 from june.activity import ActivityManager
@@ -272,6 +272,30 @@ def test__static_geography(dummy_world):
         )
 
 
+def test__read_table_fields(dummy_world):
+    record = Record(record_path="results", record_static_data=True,)
+    record.static_data(world=dummy_world)
+    read = RecordReader(results_path=record.record_path)
+    for table_name, fields in (
+        ("areas", ("super_area_id", "name")),
+        ("super_areas", ("name",)),
+        ("regions", ("id", "name")),
+    ):
+        full_df = read.table_to_df(table_name)
+        fields_df = read.table_to_df(table_name, fields=fields)
+        fields = [field for field in fields if field != "id"]
+        assert list(fields_df.columns) == fields
+        pd.testing.assert_frame_equal(fields_df, full_df[fields])
+    area_names = read.table_to_df("areas", fields=("name",))["name"]
+    assert list(area_names) == [area.name for area in dummy_world.areas]
+    geography_df = read.get_geography_df()
+    for area in dummy_world.areas:
+        row = geography_df.loc[area.id]
+        assert row["name_area"] == area.name
+        assert row["name_super_area"] == area.super_area.name
+        assert row["name_region"] == area.super_area.region.name
+
+
 def test__sumarise_time_tep(dummy_world):
     dummy_world.people = Population(dummy_world.people)
 